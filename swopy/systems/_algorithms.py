@@ -196,28 +196,34 @@ def reversed_char_sum_from_numeral(
     return char_sum_from_numeral(numeral[::-1], from_map, system_name)
 
 
-def subtractive_to_numeral(number: int, numeral_map: Mapping[int, str]) -> str:
+def subtractive_to_numeral(
+    number: int | Fraction, numeral_items: Iterable[tuple[int | Fraction, str]]
+) -> str:
     """Convert an integer to a numeral string using subtractive decomposition.
 
-    Iterates the map in its defined order (largest denomination first). For each
-    denomination, the corresponding glyph is appended and the denomination
-    subtracted as many times as it fits, rather than using ``divmod``. This
-    allows multi-character subtractive pairs (e.g. ⅠⅩ for 9) to be expressed
-    as single map entries.
+    Iterates the items in their defined order (largest denomination first),
+    consuming as many copies of each denomination as fit. Multi-character
+    subtractive pairs (e.g. ⅠⅩ for 9) are expressed as single map entries, so
+    the glyph for each denomination is simply repeated ``count`` times.
 
     Args:
         number: The Arabic number to convert.
-        numeral_map: Ordered mapping from denomination values to their glyphs.
-            May include subtractive pairs as multi-character glyph values.
+        numeral_items: Ordered iterable of ``(denomination, glyph)`` pairs,
+            largest denomination first.  May include subtractive pairs as
+            multi-character glyph values.  Callers should pass a pre-computed
+            items tuple (e.g. ``cls._to_numeral_items``) to avoid repeated
+            ``dict.items()`` view allocations on the hot path.
 
     Returns:
         The numeral string representation of ``number``.
     """
     result = ""
-    for value, glyph in numeral_map.items():
-        while number >= value:
-            result += glyph
-            number -= value
+    for value, glyph in numeral_items:
+        if value > number:
+            continue
+        count = number // value
+        number %= value
+        result += glyph * count
         if not number:
             break
     return result
@@ -230,15 +236,18 @@ def subtractive_from_numeral(
 ) -> int:
     """Convert a subtractive numeral string to an integer.
 
-    Scans ``numeral`` right-to-left (after upper-casing). A character whose
-    value is smaller than the previously seen character's value is subtracted
-    rather than added, implementing the standard subtractive rule
-    (e.g. ⅠⅩ → 9).
+    Scans ``numeral`` right-to-left. A character whose value is smaller than
+    the previously seen character's value is subtracted rather than added,
+    implementing the standard subtractive rule (e.g. ⅠⅩ → 9). A forward scan
+    with a one-character peek was benchmarked and found slower; ``reversed()``
+    over a str iterates at C level while the peek needs a per-position
+    subscript (see performance history 15).
 
     Args:
         numeral: The numeral string to convert.
         from_map: Mapping from individual characters to their numeric values.
-            Both upper- and lower-case variants should be included.
+            Both upper- and lower-case variants must be included; no case
+            folding is performed here, avoiding a per-call string allocation.
         system_name: Human-readable system name used in the error message.
 
     Returns:
@@ -249,7 +258,7 @@ def subtractive_from_numeral(
     """
     total = 0
     prev_value = 0
-    for char in reversed(numeral.upper()):
+    for char in reversed(numeral):
         current_value = from_map.get(char)
         if current_value is None:
             raise ValueError(f"Invalid {system_name} character: {char!r}")
@@ -261,6 +270,77 @@ def subtractive_from_numeral(
     return total
 
 
+def make_longest_match_index(from_map: Mapping[str, int]) -> dict[str | None, Any]:
+    """Build a character trie over ``from_map`` for longest-match scanning.
+
+    Each node is a dict mapping the next character to a child node; the
+    ``None`` key marks a terminal node and holds the ``(symbol, value)`` pair
+    for the token ending there.  Callers should build the trie once at class
+    definition time (e.g. as a ``_from_numeral_index`` ClassVar) and pass it
+    to ``longest_match_from_numeral`` so that each position is resolved by
+    walking the trie instead of probing every token in the map.
+
+    Args:
+        from_map: Mapping from token strings to their numeric values.
+
+    Returns:
+        The root node of the trie.
+    """
+    root: dict[str | None, Any] = {}
+    for symbol, value in from_map.items():
+        node = root
+        for char in symbol:
+            node = node.setdefault(char, {})
+        node[None] = (symbol, value)
+    return root
+
+
+def _longest_match_indexed(
+    numeral: str,
+    index: dict[str | None, Any],
+    system_name: str,
+    *,
+    enforce_descending: bool,
+    last_value: int,
+) -> int:
+    """Longest-match scan of ``numeral`` driven by a pre-computed trie.
+
+    See ``longest_match_from_numeral`` for semantics and
+    ``make_longest_match_index`` for the trie layout.
+    """
+    total = 0
+    i = 0
+    n = len(numeral)
+    while i < n:
+        node = index
+        match: tuple[str, int] | None = None
+        j = i
+        while j < n:
+            node = node.get(numeral[j])
+            if node is None:
+                break
+            j += 1
+            if None in node:
+                match = node[None]
+
+        if match is None:
+            raise ValueError(
+                f"Invalid {system_name} character at position {i}: {numeral[i]!r}"
+            )
+
+        symbol, value = match
+        if enforce_descending and value > last_value:
+            raise ValueError(
+                f"Invalid {system_name} sequence: {symbol!r} cannot follow"
+                " a smaller value."
+            )
+        total += value
+        last_value = value
+        i += len(symbol)
+
+    return total
+
+
 def longest_match_from_numeral(  # noqa: PLR0913
     numeral: str,
     from_map: Mapping[str, int],
@@ -269,6 +349,7 @@ def longest_match_from_numeral(  # noqa: PLR0913
     case_fold: bool = False,
     enforce_descending: bool = False,
     initial_max: int | None = None,
+    index: dict[str | None, Any] | None = None,
 ) -> int:
     """Convert a numeral string to an integer using longest-match scanning.
 
@@ -290,6 +371,11 @@ def longest_match_from_numeral(  # noqa: PLR0913
         initial_max: Sentinel used as the "previous value" before the first
             token when ``enforce_descending`` is ``True``. Defaults to
             ``max(from_map.values()) + 1``, permitting any valid first token.
+        index: Pre-computed trie over ``from_map`` (see
+            ``make_longest_match_index``). When provided, each position is
+            resolved with a single trie walk instead of probing every token.
+            Pass ``cls._from_numeral_index`` from callers to avoid the
+            per-position map scan.
 
     Returns:
         The integer value of ``numeral``.
@@ -308,6 +394,15 @@ def longest_match_from_numeral(  # noqa: PLR0913
         else 0
     )
 
+    if index is not None:
+        return _longest_match_indexed(
+            numeral,
+            index,
+            system_name,
+            enforce_descending=enforce_descending,
+            last_value=last_value,
+        )
+
     total = 0
     i = 0
     while i < len(numeral):
@@ -20,12 +20,13 @@ their constituent single-character unit signs.
 
 from collections.abc import Mapping
 from fractions import Fraction
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from ..system import Encodings, System
 from ._algorithms import (
     greedy_additive_to_numeral,
     longest_match_from_numeral,
+    make_longest_match_index,
     multiplicative_additive_from_numeral,
     multiplicative_additive_to_numeral,
 )
@@ -188,6 +189,10 @@ class Bhaiksuki(System[str, int]):
     # that longest_match_from_numeral resolves them correctly.
     _from_numeral_map: Mapping[str, int] = {v: k for k, v in _to_numeral_map.items()}
 
+    _from_numeral_index: ClassVar[dict[str | None, Any]] = make_longest_match_index(
+        _from_numeral_map
+    )
+
     @classmethod
     def _to_numeral(cls, denotation: int) -> str:
         """Convert an integer to Bhaiksuki numerals
@@ -242,4 +247,9 @@ class Bhaiksuki(System[str, int]):
                 ...
             ValueError: Invalid Bhaiksuki character at position 0: '?'
         """
-        return longest_match_from_numeral(numeral, cls._from_numeral_map, cls.__name__)
+        return longest_match_from_numeral(
+            numeral,
+            cls._from_numeral_map,
+            cls.__name__,
+            index=cls._from_numeral_index,
+        )
@@ -107,12 +107,13 @@ class Ahom(System[str, int]):
         """
         _digit_base = 0x11730
         total = 0
+        from_map = cls._from_numeral_map
         for char in numeral:
-            if char not in cls._from_numeral_map:
+            if char not in from_map:
                 raise ValueError(f"Invalid Ahom character: {char!r}")
             cp = ord(char)
             if _digit_base <= cp <= _digit_base + 9:
                 total = total * 10 + (cp - _digit_base)
             else:
-                total += cls._from_numeral_map[char]
+                total += from_map[char]
         return total
@@ -20,13 +20,14 @@ scanning is used for decoding, enforcing descending order.
 
 from collections.abc import Mapping
 from fractions import Fraction
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from ..system import Encodings, System
 from ._algorithms import (
     char_sum_from_numeral,
     greedy_additive_to_numeral,
     longest_match_from_numeral,
+    make_longest_match_index,
 )
 
 
@@ -197,6 +198,10 @@ class CopticEpact(System[str, int]):
         "\U000102e1": 1,  # 𐋡
     }
 
+    _from_numeral_index: ClassVar[dict[str | None, Any]] = make_longest_match_index(
+        _from_numeral_map
+    )
+
     @classmethod
     def _to_numeral(cls, denotation: int) -> str:
         """Convert an integer to Coptic Epact numerals.
@@ -257,4 +262,5 @@ class CopticEpact(System[str, int]):
             cls.__name__,
             enforce_descending=True,
             initial_max=int(cls.maximum) + 1,
+            index=cls._from_numeral_index,
         )
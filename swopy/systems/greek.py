@@ -37,13 +37,14 @@ decoding reverses the input before summing.
 
 from collections.abc import Mapping
 from fractions import Fraction
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from ..system import Encodings, System
 from ._algorithms import (
     char_sum_from_numeral,
     greedy_additive_to_numeral,
     longest_match_from_numeral,
+    make_longest_match_index,
     reversed_char_sum_from_numeral,
     reversed_greedy_additive_to_numeral,
 )
@@ -191,6 +192,10 @@ class Milesian(System[str, int]):
         "\u03e1": 900,  # ϡ
     }
 
+    _from_numeral_index: ClassVar[dict[str | None, Any]] = make_longest_match_index(
+        _from_numeral_map
+    )
+
     @classmethod
     def _to_numeral(cls, denotation: int) -> str:
         """Convert an integer to Greek Milesian numerals.
@@ -237,7 +242,12 @@ class Milesian(System[str, int]):
             >>> Milesian._from_numeral('͵θϡϙθ')
             9999
         """
-        return longest_match_from_numeral(numeral, cls._from_numeral_map, cls.__name__)
+        return longest_match_from_numeral(
+            numeral,
+            cls._from_numeral_map,
+            cls.__name__,
+            index=cls._from_numeral_index,
+        )
 
 
 class Aegean(System[str, int]):
@@ -745,6 +755,10 @@ class Alphabetic(System[str, int]):
         "\u03e1": 900,  # ϡ sampi (lowercase)
     }
 
+    _from_numeral_index: ClassVar[dict[str | None, Any]] = make_longest_match_index(
+        _from_numeral_map
+    )
+
     @classmethod
     def _to_numeral(cls, denotation: int) -> str:
         """Convert an Arabic integer to a Greek Alphabetic numeral.
@@ -798,4 +812,9 @@ class Alphabetic(System[str, int]):
         """
         if numeral.endswith(_KERAIA):
             numeral = numeral[:-1]
-        return longest_match_from_numeral(numeral, cls._from_numeral_map, cls.__name__)
+        return longest_match_from_numeral(
+            numeral,
+            cls._from_numeral_map,
+            cls.__name__,
+            index=cls._from_numeral_index,
+        )
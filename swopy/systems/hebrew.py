@@ -28,10 +28,14 @@ Both regular and final letterforms are accepted in decoding.
 
 from collections.abc import Mapping
 from fractions import Fraction
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from ..system import Encodings, System
-from ._algorithms import greedy_additive_to_numeral, longest_match_from_numeral
+from ._algorithms import (
+    greedy_additive_to_numeral,
+    longest_match_from_numeral,
+    make_longest_match_index,
+)
 
 # Geresh prefix used to mark thousands
 _GERESH = "\u05f3"  # ׳
@@ -135,6 +139,10 @@ class Hebrew(System[str, int]):
         "\u05f4": 0,  # ״  gershayim (punctuation, ignored)
     }
 
+    _from_numeral_index: ClassVar[dict[str | None, Any]] = make_longest_match_index(
+        _from_numeral_map
+    )
+
     @classmethod
     def _to_numeral(cls, denotation: int) -> str:
         """Convert an integer to Hebrew numerals.
@@ -204,4 +212,9 @@ class Hebrew(System[str, int]):
                 ...
             ValueError: Invalid Hebrew character at position 0: '?'
         """
-        return longest_match_from_numeral(numeral, cls._from_numeral_map, cls.__name__)
+        return longest_match_from_numeral(
+            numeral,
+            cls._from_numeral_map,
+            cls.__name__,
+            index=cls._from_numeral_index,
+        )
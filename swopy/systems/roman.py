@@ -18,16 +18,29 @@ values.
 
 from collections.abc import Mapping
 from fractions import Fraction
-from typing import ClassVar
+from functools import lru_cache
+from typing import Any, ClassVar
 
 from ..system import Encodings, System
 from ._algorithms import (
     longest_match_from_numeral,
+    make_longest_match_index,
     subtractive_from_numeral,
     subtractive_to_numeral,
 )
 
 
+def _make_to_numeral_table(m: Mapping[Any, str], maximum: int) -> tuple[str, ...]:
+    """Pre-compute the subtractive encoding for all integers 0-``maximum``.
+
+    Called once at class definition time so that the integer portion of
+    ``_to_numeral`` becomes a single tuple index.  Index 0 holds the empty
+    string, covering the integer part of purely fractional denotations.
+    """
+    items = tuple(m.items())
+    return tuple(subtractive_to_numeral(n, items) for n in range(maximum + 1))
+
+
 class Early(System[str, int]):
     """Implements bidirectional conversion between integers and Early Roman numerals.
 
@@ -58,17 +71,29 @@ class Early(System[str, int]):
     }
     _from_numeral_map: Mapping[str, int] = {
         "\u2160": 1,
+        "\u2170": 1,
         "I": 1,
+        "i": 1,
         "\u2164": 5,
+        "\u2174": 5,
         "V": 5,
+        "v": 5,
         "\u2169": 10,
+        "\u2179": 10,
         "X": 10,
+        "x": 10,
         "\u216c": 50,
+        "\u217c": 50,
         "L": 50,
+        "l": 50,
         "\u216d": 100,
+        "\u217d": 100,
         "C": 100,
+        "c": 100,
         "\u216e": 500,
+        "\u217e": 500,
         "D": 500,
+        "d": 500,
     }
 
     minimum: ClassVar[int | float | Fraction] = 1
@@ -76,6 +101,10 @@ class Early(System[str, int]):
     maximum_is_many: ClassVar[bool] = False
     encodings: ClassVar[Encodings] = {"utf8", "ascii"}
 
+    _to_numeral_table: ClassVar[tuple[str, ...]] = _make_to_numeral_table(
+        _to_numeral_map, 899
+    )
+
     @classmethod
     def _to_numeral(cls, denotation: int) -> str:
         """Converts an integer to a Early Roman numeral.
@@ -97,9 +126,10 @@ class Early(System[str, int]):
                 ...
             ValueError: Number must be less than or equal to 899.
         """
-        return subtractive_to_numeral(denotation, cls._to_numeral_map)
+        return cls._to_numeral_table[denotation]
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def _from_numeral(cls, numeral: str) -> int:
         """Converts an Early Roman numeral to an integer.
 
@@ -183,20 +213,44 @@ class Standard(System[str, int | Fraction]):
         "S∷": Fraction(5, 6),
         "S·····": Fraction(11, 12),
         "S⁙": Fraction(11, 12),
+        "s": Fraction(1, 2),
+        "s·": Fraction(7, 12),
+        "s··": Fraction(2, 3),
+        "s:": Fraction(2, 3),
+        "s···": Fraction(3, 4),
+        "s∴": Fraction(3, 4),
+        "s····": Fraction(5, 6),
+        "s∷": Fraction(5, 6),
+        "s·····": Fraction(11, 12),
+        "s⁙": Fraction(11, 12),
         "\u2160": 1,
+        "\u2170": 1,
         "I": 1,
+        "i": 1,
         "\u2164": 5,
+        "\u2174": 5,
         "V": 5,
+        "v": 5,
         "\u2169": 10,
+        "\u2179": 10,
         "X": 10,
+        "x": 10,
         "\u216c": 50,
+        "\u217c": 50,
         "L": 50,
+        "l": 50,
         "\u216d": 100,
+        "\u217d": 100,
         "C": 100,
+        "c": 100,
         "\u216e": 500,
+        "\u217e": 500,
         "D": 500,
+        "d": 500,
         "\u216f": 1_000,
+        "\u217f": 1_000,
         "M": 1_000,
+        "m": 1_000,
     }
 
     minimum: ClassVar[int | float | Fraction] = Fraction(1, 12)
@@ -204,6 +258,10 @@ class Standard(System[str, int | Fraction]):
     maximum_is_many: ClassVar[bool] = False
     encodings: ClassVar[Encodings] = {"utf8", "ascii"}
 
+    _to_numeral_table: ClassVar[tuple[str, ...]] = _make_to_numeral_table(
+        _to_numeral_map, 3_999
+    )
+
     @classmethod
     def _to_numeral(cls, denotation: int | Fraction) -> str:
         """Converts an integer or fraction to a Roman numeral.
@@ -225,17 +283,10 @@ class Standard(System[str, int | Fraction]):
                 ...
             ValueError: Denotation must be less than or equal to 899.
         """
-        result: str = ""
-
         integer = int(denotation)
         proper_fraction = denotation - integer
 
-        for arabic, roman in cls._to_numeral_items:
-            while integer >= arabic:
-                result += roman
-                integer -= arabic
-            if not integer:
-                break
+        result: str = cls._to_numeral_table[integer]
 
         if proper_fraction == 0:
             return result
@@ -247,6 +298,7 @@ class Standard(System[str, int | Fraction]):
         return result + fraction_glyph
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def _from_numeral(cls, numeral: str) -> int | Fraction:
         """Converts a Roman numeral to an integer or fraction.
 
@@ -268,15 +320,16 @@ class Standard(System[str, int | Fraction]):
         total: int | Fraction = 0
         prev_value: int | Fraction = 0
         prev_char: str | None = None
+        get = cls._from_numeral_map.get
 
-        for char in reversed(numeral.upper()):
-            current_value = cls.from_numeral_map().get(char)
+        for char in reversed(numeral):
+            current_value = get(char)
 
             if current_value is None:
                 raise ValueError(f"Invalid Roman character: {char}")
 
-            if char == "S" and prev_char:
-                combined_value = cls.from_numeral_map().get(char + prev_char)
+            if prev_char and char in "Ss":
+                combined_value = get(char + prev_char)
                 if combined_value is None:
                     raise ValueError(f"Invalid Roman character: {char + prev_char}")
                 total += combined_value - prev_value
@@ -325,33 +378,79 @@ class Apostrophus(Early):
     }
     _from_numeral_map: Mapping[str, int] = {
         "CCCⅠↃↃↃ": 100_000,
+        "cccⅰↄↄↄ": 100_000,
         "CCCI)))": 100_000,
+        "ccci)))": 100_000,
         "ⅠↃↃↃ": 50_000,
+        "ⅰↄↄↄ": 50_000,
         "I)))": 50_000,
+        "i)))": 50_000,
         "CCⅠↃↃ": 10_000,
+        "ccⅰↄↄ": 10_000,
         "CCI))": 10_000,
+        "cci))": 10_000,
         "ⅠↃↃ": 5_000,
+        "ⅰↄↄ": 5_000,
         "I))": 5_000,
+        "i))": 5_000,
         "CⅠↃ": 1_000,
+        "cⅰↄ": 1_000,
         "CI)": 1_000,
+        "ci)": 1_000,
         "ⅠↃ": 500,
+        "ⅰↄ": 500,
         "I)": 500,
+        "i)": 500,
         "C": 100,
+        "c": 100,
         "\u216c": 50,
+        "\u217c": 50,
         "L": 50,
+        "l": 50,
         "\u2169": 10,
+        "\u2179": 10,
         "X": 10,
+        "x": 10,
         "\u2164": 5,
+        "\u2174": 5,
         "V": 5,
+        "v": 5,
         "\u2160": 1,
+        "\u2170": 1,
         "I": 1,
+        "i": 1,
     }
 
+    _from_numeral_index: ClassVar[dict[str | None, Any]] = make_longest_match_index(
+        _from_numeral_map
+    )
+
     maximum: ClassVar[int | float | Fraction] = 100_000
     maximum_is_many: ClassVar[bool] = False
     encodings: ClassVar[Encodings] = {"utf8", "ascii"}
 
     @classmethod
+    @lru_cache(maxsize=4096)
+    def _to_numeral(cls, denotation: int) -> str:
+        """Converts an integer to a Roman numeral of the Apostrophus form.
+
+        The 100,000-value domain is too large to pre-compute as a table (unlike
+        Early and Standard), so conversion stays lazy behind the lru_cache.
+
+        Examples:
+            >>> Apostrophus.to_numeral(1_000)
+            'CⅠↃ'
+            >>> Apostrophus.to_numeral(501)
+            'ⅠↃⅠ'
+            >>> Apostrophus.to_numeral(100_001)
+            Traceback (most recent call last):
+                ...
+            ValueError: Denotation must be less than or equal to 100000.
+        """
+        return subtractive_to_numeral(denotation, cls._to_numeral_items)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
     def _from_numeral(cls, numeral: str) -> int:
         """Converts a Roman numeral of the Apostrophus form to an integer.
 
@@ -378,7 +477,7 @@ class Apostrophus(Early):
             numeral,
             cls._from_numeral_map,
             cls.__name__,
-            case_fold=True,
             enforce_descending=True,
             initial_max=int(cls.maximum) + 1,
+            index=cls._from_numeral_index,
         )
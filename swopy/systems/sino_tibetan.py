@@ -410,10 +410,11 @@ class Suzhou(System[str, int]):
             ValueError: Invalid Suzhou character: '?'
         """
         total = 0
+        from_map = cls._from_numeral_map
         for char in numeral:
-            if char not in cls._from_numeral_map:
+            if char not in from_map:
                 raise ValueError(f"Invalid Suzhou character: {char!r}")
-            value = cls._from_numeral_map[char]
+            value = from_map[char]
             # Detect shorthand numerals and prevent their use mid-string
             if value >= 10:  # noqa: PLR2004
                 if len(numeral) != 1:
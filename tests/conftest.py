@@ -0,0 +1,35 @@
+"""Shared pytest configuration for the swopy test suite.
+
+Registers Hypothesis settings profiles so per-test example budgets can be
+tuned without editing the frozen API test modules (``test_systems.py`` and
+``test_swopy.py``). The default profile keeps Hypothesis's stock settings;
+the ``fast`` profile trims the example budget for quick local iteration on
+the quadratic round-trip tests; the ``ci`` profile disables the 200ms
+deadline (cold imports and first-call method resolution on System
+subclasses can exceed it, triggering flaky re-runs) and derandomizes
+example generation so CI runs are reproducible.
+
+Select a profile with the ``HYPOTHESIS_PROFILE`` environment variable:
+
+    HYPOTHESIS_PROFILE=fast pytest
+"""
+
+import os
+
+from hypothesis import HealthCheck, settings
+
+settings.register_profile(
+    "fast",
+    max_examples=25,
+    deadline=None,
+    suppress_health_check=[HealthCheck.filter_too_much],
+)
+
+settings.register_profile(
+    "ci",
+    deadline=None,
+    print_blob=False,
+    derandomize=True,
+)
+
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "default"))
@@ -18,6 +18,7 @@ Usage
 """
 
 from fractions import Fraction
+from functools import cache
 from math import inf
 from typing import Any
 
@@ -87,6 +88,7 @@ def _resolve_bounds[
     return lo, hi
 
 
+@cache
 def make_strategy[
     TFromNumeral: Numeral,
     TFromDenotation: Denotation,
@@ -102,6 +104,11 @@ def make_strategy[
     Build a Hypothesis strategy appropriate for the numeric type of from_system*,
     constrained to the intersection of bounds when to_system* is supplied.
 
+    Strategies are immutable and reusable across draws, and every argument is
+    hashable, so the construction (kind inference, bound resolution and
+    Hypothesis validation) is memoised; the property tests draw from the same
+    strategy once per example.
+
     Args:
         from_system: The primary System class. Its numeric type (float, int, Fraction,
             base-N fraction etc.) determines which strategy is generated.
@@ -164,7 +171,7 @@ def _is_fraction_kind(k: Any) -> bool:
 
 
 def _resolve_sampled_kinds(
-    kinds: set[Any],
+    kinds: frozenset[Any],
     sampled: list[SampledFractions],
     frac_bases: list[int],
 ) -> set[Any]:
@@ -183,7 +190,7 @@ def _resolve_sampled_kinds(
 
 
 def _resolve_base_n_kinds(
-    kinds: set[Any],
+    kinds: frozenset[Any],
     frac_bases: list[int],
 ) -> set[Any]:
     """Replace fraction-related kinds with a compatible BaseNFraction."""
@@ -199,6 +206,7 @@ def _resolve_base_n_kinds(
     return resolved
 
 
+@cache
 def make_double_strategy[
     TFromNumeral: Numeral,
     TFromDenotation: Denotation,
@@ -208,19 +216,24 @@ def make_double_strategy[
     from_system: type[System[TFromNumeral, TFromDenotation]],
     to_system: type[System[TToNumeral, TToDenotation]],
     falsify: bool = False,
-) -> list[SearchStrategy[Any]]:
+) -> tuple[SearchStrategy[Any], ...]:
     """
     Build a Hypothesis strategy that's (in)appropriate for the types of from_system
     and to_system, constrained to the intersection of the minimum and maximum of the two
     systems.
 
+    Memoised for the same reason as make_strategy: the result is a pure
+    function of the class pair, and the round-trip tests rebuild it once per
+    Hypothesis example.  Returns a tuple so the cached value is immutable.
+
     Args:
         from_system: The source numeral system.
         to_system: The target numeral system.
         falsify: Is the test designed to fail?
 
     Returns:
-        A Hypothesis SearchStrategy for all (in)valid types for the Systems
+        A tuple of Hypothesis SearchStrategies for all (in)valid types for the
+            Systems
     """
     from_kinds = infer_numeric_kind(from_system)
     to_kinds = infer_numeric_kind(to_system)
@@ -253,4 +266,4 @@ def make_double_strategy[
         builder = builders.get_builder(kind)
         builders_.append(builder.build(kind, lo, hi))
 
-    return builders_
+    return tuple(builders_)
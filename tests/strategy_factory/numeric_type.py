@@ -18,6 +18,7 @@ import math
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from fractions import Fraction
+from functools import cache
 from typing import Any
 
 from swopy import System
@@ -114,9 +115,15 @@ def _infer_base(fractions: list[Fraction]) -> int | None:
     return base
 
 
-def infer_numeric_kind(system: type[System[Any, Any]]) -> set[NumericKind]:
+@cache
+def infer_numeric_kind(system: type[System[Any, Any]]) -> frozenset[NumericKind]:
     """Inspect a System subclass and return its NumericKind.
 
+    The result is a pure function of the class (runtime types and the fraction
+    closure of its map values never change after class creation), so it is
+    memoised; the strategy factory calls this once per Hypothesis example.
+    A frozenset is returned so the cached value cannot be mutated.
+
     Args:
         system: The system to be assessed
 
@@ -154,4 +161,4 @@ def infer_numeric_kind(system: type[System[Any, Any]]) -> set[NumericKind]:
         else:
             kinds.add(Fraction)
 
-    return kinds
+    return frozenset(kinds)
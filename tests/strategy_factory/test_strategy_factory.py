@@ -205,7 +205,7 @@ def test_infers_plain_fraction():
 
 
 def test_infers_base12_fraction():
-    kind = infer_numeric_kind(Base12FractionSystem).pop()
+    kind = next(iter(infer_numeric_kind(Base12FractionSystem)))
     assert isinstance(kind, BaseNFraction)
     assert kind.base == 12  # noqa: PLR2004
 
@@ -236,8 +236,8 @@ class TestDoubleSampledFractionsStrategy:
     """make_double_strategy with two SampledFractions systems intersects their sets."""
 
     def test_infers_sampled_kinds(self):
-        kind_a = infer_numeric_kind(SampledASystem).pop()
-        kind_b = infer_numeric_kind(SampledBSystem).pop()
+        kind_a = next(iter(infer_numeric_kind(SampledASystem)))
+        kind_b = next(iter(infer_numeric_kind(SampledBSystem)))
         assert isinstance(kind_a, SampledFractions)
         assert isinstance(kind_b, SampledFractions)
 
@@ -261,6 +261,6 @@ def test_infers_base_from_simple_halves_and_quarters():
             "three_quarters": Fraction(3, 4),
         }
 
-    kind = infer_numeric_kind(Base4System).pop()
+    kind = next(iter(infer_numeric_kind(Base4System)))
     assert isinstance(kind, BaseNFraction)
     assert kind.base == 4  # noqa: PLR2004
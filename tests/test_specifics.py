@@ -20,12 +20,14 @@ from swopy.systems._algorithms import (
     char_sum_from_numeral,
     greedy_additive_to_numeral,
     longest_match_from_numeral,
+    make_longest_match_index,
     multiplicative_additive_from_numeral,
     multiplicative_additive_to_numeral,
     multiplicative_myriad_from_numeral,
     multiplicative_myriad_to_numeral,
     positional_to_numeral,
     reversed_greedy_additive_to_numeral,
+    subtractive_from_numeral,
     subtractive_to_numeral,
 )
 
@@ -51,6 +53,23 @@ class TestRomanStandard:
         with pytest.raises(ValueError):
             systems.roman.Standard.to_numeral(Fraction(1, 7))
 
+    def test_lowercase_double_half(self) -> None:
+        """
+        Checks that a value error is raised when two incompatible
+        fraction characters are used in lower case
+        """
+        with pytest.raises(ValueError):
+            systems.roman.Standard.from_numeral("ss")
+
+    @given(strategies.integers(min_value=1, max_value=3999))
+    def test_lowercase_from_numeral(self, number: int) -> None:
+        """
+        Checks that lower-cased numerals decode to the same value as the
+        canonical upper-case form now that no case folding is performed
+        """
+        numeral = systems.roman.Standard.to_numeral(number)
+        assert systems.roman.Standard.from_numeral(numeral.lower()) == number
+
 
 class TestRomanApostrophus:
     """
@@ -523,6 +542,102 @@ class TestAlgorithmsLongestMatch:
             numeral, m, "Apostrophus", case_fold=True, enforce_descending=True
         )
 
+    def test_invalid_character(self) -> None:
+        """The non-indexed probe loop reports unknown characters."""
+        m = systems.hebrew.Hebrew._from_numeral_map  # pyright: ignore[reportPrivateUsage]
+        with pytest.raises(
+            ValueError, match="Invalid Hebrew character at position 0: '\\?'"
+        ):
+            longest_match_from_numeral("?", m, "Hebrew")
+
+    def test_descending_violation(self) -> None:
+        """The non-indexed probe loop enforces descending token order."""
+        m = systems.roman.Apostrophus._from_numeral_map  # pyright: ignore[reportPrivateUsage]
+        with pytest.raises(
+            ValueError, match="Invalid Apostrophus sequence: 'X' cannot follow"
+        ):
+            longest_match_from_numeral(
+                "VX",
+                m,
+                "Apostrophus",
+                case_fold=True,
+                enforce_descending=True,
+            )
+
+
+class TestAlgorithmsLongestMatchIndexed:
+    """Checks the trie-indexed longest_match_from_numeral path against the original.
+
+    Passing ``index=make_longest_match_index(from_map)`` replaces the per-position
+    token probe with a single trie walk; these tests verify that the indexed path
+    produces identical results and identical errors to the verbatim reference in
+    ``TestAlgorithmsLongestMatch``.
+    """
+
+    _reference = staticmethod(TestAlgorithmsLongestMatch._reference)
+
+    @given(strategies.integers(min_value=1, max_value=9999))
+    def test_hebrew(self, number: int) -> None:
+        """Hebrew map: 37 entries, default options."""
+        numeral = systems.hebrew.Hebrew.to_numeral(number)
+        m = systems.hebrew.Hebrew._from_numeral_map  # pyright: ignore[reportPrivateUsage]
+        index = make_longest_match_index(m)
+        assert longest_match_from_numeral(
+            numeral, m, "Hebrew", index=index
+        ) == self._reference(numeral, m, "Hebrew")
+
+    @given(strategies.integers(min_value=1, max_value=9999))
+    def test_greek_milesian(self, number: int) -> None:
+        """Greek Milesian map: 72 entries — largest map, exercises the hot path."""
+        numeral = systems.greek.Milesian.to_numeral(number)
+        m = systems.greek.Milesian._from_numeral_map  # pyright: ignore[reportPrivateUsage]
+        index = make_longest_match_index(m)
+        assert longest_match_from_numeral(
+            numeral, m, "Milesian", index=index
+        ) == self._reference(numeral, m, "Milesian")
+
+    @given(strategies.integers(min_value=1, max_value=100_000))
+    def test_roman_apostrophus(self, number: int) -> None:
+        """Roman Apostrophus: case_fold + enforce_descending + multi-char tokens."""
+        numeral = systems.roman.Apostrophus.to_numeral(number)
+        m = systems.roman.Apostrophus._from_numeral_map  # pyright: ignore[reportPrivateUsage]
+        index = make_longest_match_index(m)
+        assert longest_match_from_numeral(
+            numeral,
+            m,
+            "Apostrophus",
+            case_fold=True,
+            enforce_descending=True,
+            index=index,
+        ) == self._reference(
+            numeral, m, "Apostrophus", case_fold=True, enforce_descending=True
+        )
+
+    def test_invalid_character(self) -> None:
+        """The indexed path reports unknown characters with the same message."""
+        m = systems.hebrew.Hebrew._from_numeral_map  # pyright: ignore[reportPrivateUsage]
+        index = make_longest_match_index(m)
+        with pytest.raises(
+            ValueError, match="Invalid Hebrew character at position 0: '\\?'"
+        ):
+            longest_match_from_numeral("?", m, "Hebrew", index=index)
+
+    def test_descending_violation(self) -> None:
+        """The indexed path enforces descending token order with the same message."""
+        m = systems.roman.Apostrophus._from_numeral_map  # pyright: ignore[reportPrivateUsage]
+        index = make_longest_match_index(m)
+        with pytest.raises(
+            ValueError, match="Invalid Apostrophus sequence: 'X' cannot follow"
+        ):
+            longest_match_from_numeral(
+                "VX",
+                m,
+                "Apostrophus",
+                case_fold=True,
+                enforce_descending=True,
+                index=index,
+            )
+
 
 class TestAlgorithmsMultiplicativeAdditive:
     """Checks multiplicative_additive_from_numeral against the verbatim original.
@@ -833,6 +948,11 @@ class TestAlgorithmsSubtractiveTo:
     The reference implementation below is a permanent copy of the algorithm as
     it existed before any optimisation.  These tests should remain unchanged so
     that future rewrites can be validated against it.
+
+    The reference accepts a Mapping and calls .items() internally.  The live
+    function now accepts a pre-computed items sequence (tuple of pairs) so tests
+    pass ``tuple(m.items())`` to bridge the two APIs while keeping the reference
+    unchanged.
     """
 
     @staticmethod
@@ -850,7 +970,9 @@ class TestAlgorithmsSubtractiveTo:
         and confirm early termination does not affect the result.
         """
         m = systems.roman.Standard.to_numeral_map()
-        assert subtractive_to_numeral(number, m) == self._reference(number, m)  # type: ignore[arg-type]
+        assert subtractive_to_numeral(number, tuple(m.items())) == self._reference(
+            number, m
+        )
 
     @given(
         strategies.fractions(
@@ -862,10 +984,123 @@ class TestAlgorithmsSubtractiveTo:
     def test_roman_standard_fractions(self, number: Fraction) -> None:
         """Roman Standard: fractional inputs exercise the Fraction tail of the map."""
         m = systems.roman.Standard.to_numeral_map()
-        assert (  # type: ignore[arg-type]
-            subtractive_to_numeral(number, m)  # type: ignore[arg-type]
-            == self._reference(number, m)
+        assert subtractive_to_numeral(number, tuple(m.items())) == self._reference(
+            number, m
+        )
+
+
+class TestAlgorithmsSubtractiveFrom:
+    """Checks that any new subtractive_from_numeral matches the verbatim original.
+
+    The reference implementation below is a permanent copy of the algorithm as
+    it existed before any optimisation.  These tests should remain unchanged so
+    that future rewrites can be validated against it.
+
+    The reference upper-cases the numeral before scanning.  The live function
+    no longer allocates an upper-cased copy and instead requires both cases in
+    ``from_map``; the mixed-case test confirms the two remain equivalent.
+    """
+
+    @staticmethod
+    def _reference(numeral: str, from_map: Mapping[str, int], system_name: str) -> int:
+        total = 0
+        prev_value = 0
+        for char in reversed(numeral.upper()):
+            current_value = from_map.get(char)
+            if current_value is None:
+                raise ValueError(f"Invalid {system_name} character: {char!r}")
+            if current_value < prev_value:
+                total -= current_value
+            else:
+                total += current_value
+            prev_value = current_value
+        return total
+
+    @given(strategies.integers(min_value=1, max_value=899))
+    def test_roman_early(self, number: int) -> None:
+        """Roman Early: canonical (upper-case) numerals."""
+        numeral = systems.roman.Early.to_numeral(number)
+        m = systems.roman.Early._from_numeral_map  # pyright: ignore[reportPrivateUsage]
+        assert subtractive_from_numeral(numeral, m, "Early") == self._reference(
+            numeral, m, "Early"
+        )
+
+    @given(
+        strategies.integers(min_value=1, max_value=899),
+        strategies.integers(min_value=0),
+    )
+    def test_roman_early_mixed_case(self, number: int, mask: int) -> None:
+        """Roman Early: per-character case flips cover the dropped .upper() call."""
+        numeral = "".join(
+            char.lower() if mask >> i & 1 else char
+            for i, char in enumerate(systems.roman.Early.to_numeral(number))
         )
+        m = systems.roman.Early._from_numeral_map  # pyright: ignore[reportPrivateUsage]
+        assert subtractive_from_numeral(numeral, m, "Early") == self._reference(
+            numeral, m, "Early"
+        )
+
+
+class TestRomanStandardFromNumeralScan:
+    """Regression tests for the roman.Standard._from_numeral scan.
+
+    The reference below is a verbatim copy of the reverse-scan implementation
+    before any optimisation.  These tests should remain unchanged so that
+    future rewrites (e.g. a forward scan with peek) can be validated against
+    it on canonical numerals, where the two directions are equivalent.
+    """
+
+    @staticmethod
+    def _reference(numeral: str) -> int | Fraction:
+        from_map = systems.roman.Standard.from_numeral_map()
+        total: int | Fraction = 0
+        prev_value: int | Fraction = 0
+        prev_char: str | None = None
+
+        for char in reversed(numeral):
+            current_value = from_map.get(char)
+
+            if current_value is None:
+                raise ValueError(f"Invalid Roman character: {char}")
+
+            if prev_char and char in "Ss":
+                combined_value = from_map.get(char + prev_char)
+                if combined_value is None:
+                    raise ValueError(f"Invalid Roman character: {char + prev_char}")
+                total += combined_value - prev_value
+            elif current_value < prev_value:
+                total -= current_value
+            else:
+                total += current_value
+
+            prev_value = current_value
+            prev_char = char
+
+        return total
+
+    @given(strategies.integers(min_value=1, max_value=3999))
+    def test_integers(self, number: int) -> None:
+        """Integer inputs cover the subtractive-pair handling."""
+        numeral = systems.roman.Standard.to_numeral(number)
+        assert systems.roman.Standard.from_numeral(numeral) == self._reference(numeral)
+
+    @given(
+        strategies.integers(min_value=1, max_value=3998),
+        strategies.sampled_from([Fraction(k, 12) for k in range(1, 12)]),
+    )
+    def test_fractions(self, number: int, fraction: Fraction) -> None:
+        """Mixed integer and fraction inputs cover the S-combination handling."""
+        numeral = systems.roman.Standard.to_numeral(number + fraction)
+        assert systems.roman.Standard.from_numeral(numeral) == self._reference(numeral)
+
+    @given(
+        strategies.integers(min_value=1, max_value=3998),
+        strategies.sampled_from([Fraction(k, 12) for k in range(1, 12)]),
+    )
+    def test_fractions_lowercase(self, number: int, fraction: Fraction) -> None:
+        """Lower-cased numerals cover the 's'-combination handling."""
+        numeral = systems.roman.Standard.to_numeral(number + fraction).lower()
+        assert systems.roman.Standard.from_numeral(numeral) == self._reference(numeral)
 
 
 class TestRomanStandardToNumeralLoop: